@@ -0,0 +1,11 @@
+"""
+Authentication token literals for the automation framework.
+
+Kept out of settings.py so the large JWT strings are only marshalled and
+interned when a test actually reads one of the token attributes.
+"""
+import os
+
+AUTH_TOKEN_PANTHEON = os.getenv("AUTH_TOKEN_PANTHEON", "eyJqd3QiOiJleUpoYkdjaU9pSlNVekkxTmlJc0luUjVjQ0k2SWtwWFZDSXNJbU4wZVNJNklrcFhWQ0lzSW1wcmRTSTZJaUlzSW10cFpDSTZJaUo5LmV5SndZVzUwYUdWdmJrRjFkR2hVZVhCbElqb2lkWE5sY2lJc0ltOXJkR0ZKWkNJNkluWmhkMjkyYjJ3eE1EUkFhSEpoYVdacExtTnZiU0lzSW5CeWFXNWphWEJoYkNJNk56UTNOVGsxTENKaGRXUnBaVzVqWlNJNk1qRTFOellzSW1sdWRHVnlibUZzSWpwMGNuVmxMQ0p2Y21kaGJtbDZZWFJwYjI1SlpDSTZNakUxTnpZc0luSnZiR1Z6SWpwYkltRmtiV2x1SWl3aWRtVnVaRzl5TFcxaGJtRm5aWElpTENKa1pYWmxiRzl3WlhJaVhTd2libUZ0WlNJNklrOXViSGtnTkNCQmRYUnZiV0YwYVc5dUlDMGdSR1YyWld4dmNHVnlJQzBnVm1GM2IzWnZiQ0lzSW5WelpYSnVZVzFsSWpvaVQyNXNlU0EwSUVGMWRHOXRZWFJwYjI0Z0xTQkVaWFpsYkc5d1pYSWdMU0JXWVhkdmRtOXNJaXdpYzNSaGRIVnpJam9pWVdOMGFYWmxJaXdpYUdGelVtOWliM1JwWTB0bGVTSTZabUZzYzJVc0ltbGhkQ0k2TVRjMU9ESTVOekE1TXl3aWJtSm1Jam94TnpVNE1qazNNRGt6TENKbGVIQWlPakUzTmpBNU1qVXdPVE1zSW1semN5STZJblZ1YTI1dmQyNGlMQ0poZFdRaU9pSjFibXR1YjNkdUlpd2lhblJwSWpvaWFuZDBPblZ1WkdWbWFXNWxaQzh4TnpVNE1qazNNRGt6SW4wLlh4aWRKNkhsM2s3ZmV0YVQ2eWtzcTIwb0M0R3R1S0ZnMHUtWFFpZy1SODZBR3E1VDFkbVpqc29yMjRVWjBjbDVMbVBadFdYMzR5cWlwMzF1ZnIwWnQ2YWxXbFJWU2NUdEpDbElfeFozWTduV3BSeEZVOE5WX1VzRnhINVN1M0VsNlV3b0wtZTgyWkpYUy1hbFJ2LS13elFzSlhNZlN2Z0RDWWdZbkJfTUxBZVIzaWE1eTVJQndNSW1nQ0pVM0I0R29yY1ZKaTZaV2szQ2lxLUxodWVER1NZVUhJYW1nVWRWZnpQR2VBNzRUS2ZWdEItMy1qaXg0RVY4N0Q5MXBjTEZOeXZzUE9EVnliSkE0dThHSS1hNnFuSnJKbmFrR0RKclE4MEpvLWhtY1FVd1VoOXcwS3NjT0RSNXY3VVFfMG80c196clc3a0NkbkxSbUFUUmlnZ0UyZyIsImlzQXV0aGVudGljYXRlZCI6dHJ1ZSwiX2V4cGlyZSI6MTc4OTgzMzA5NDA3NSwiX21heEFnZSI6MzE1MzYwMDAwMDB9")
+AUTH_TOKEN_RELAY = os.getenv("AUTH_TOKEN_RELAY", "eyJhbGciOiJSUzI1NiIsInR5cCI6IkpXVCIsImN0eSI6IkpXVCIsImprdSI6IiIsImtpZCI6IiJ9.eyJwYW50aGVvbkF1dGhUeXBlIjoidXNlciIsIm9rdGFJZCI6InZhd292b2wxMDRAaHJhaWZpLmNvbSIsInByaW5jaXBhbCI6NzQ3NTk1LCJhdWRpZW5jZSI6MjE1NzYsImludGVybmFsIjp0cnVlLCJvcmdhbml6YXRpb25JZCI6MjE1NzYsInJvbGVzIjpbImFkbWluIiwidmVuZG9yLW1hbmFnZXIiLCJkZXZlbG9wZXIiXSwibmFtZSI6Ik9ubHkgNCBBdXRvbWF0aW9uIC0gRGV2ZWxvcGVyIC0gVmF3b3ZvbCIsInVzZXJuYW1lIjoiT25seSA0IEF1dG9tYXRpb24gLSBEZXZlbG9wZXIgLSBWYXdvdm9sIiwic3RhdHVzIjoiYWN0aXZlIiwiaGFzUm9ib3RpY0tleSI6ZmFsc2UsImlhdCI6MTc1ODI5NzA1OSwibmJmIjoxNzU4Mjk3MDU5LCJleHAiOjE3NjA5MjUwNTksImlzcyI6InVua25vd24iLCJhdWQiOiJ1bmtub3duIiwianRpIjoiand0OnVuZGVmaW5lZC8xNzU4Mjk3MDU5In0.uQHso28McOcB3KzKHm5JWePRSRudCCANhIkU_qKiy7C9_AjzIJwtGnmA25ZdkCfl1ToySkNwldZt-mEnGW5gTMpvR20uryP7fKBhZ6Gp0LB-1rKwP8GT1RouiIw_y4X90YDDQ7SGoc5vw9Z_s3Lu2GmJJ4HRKt5qXo6mVBSX8n7c9a1kayE9R224LdWDI9UXQVv2-JlW_MdPTORYTB4owoV-J6ZlwWTLrePjxKTHMmZdsv8eCn_KwdYUNGEmvLIH7wd9G9cffdpYxiScOVBmJ3NHVYM77cTxMqK9239NFuzK9CyKKvDx23dEBsf_LIu8mV1Vs2OWBFIgo9IaiJbOFQ")
+AUTH_CLIENT_TOKEN_OPAL = os.getenv("AUTH_CLIENT_TOKEN_OPAL", "3a9103d99f55ea4a4e2b71cab921ea86ecc333f9521c67c36d905def2c8eb17d")
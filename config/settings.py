@@ -2,11 +2,76 @@
 Configuration settings for API and UI automation.
 """
 import os
+import sys
+from dataclasses import dataclass
+from enum import IntFlag, auto
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+# Prefer the install-time snapshot generated by tools/freeze_config.py;
+# fall back to loading .env dynamically, skipping the file parse when the
+# runner already injected the variables (CI) or a previous import ran.
+try:
+    from config._frozen import ENV as _ENV
+except ImportError:
+    if not (os.getenv("CI") or os.getenv("ENV_LOADED")):
+        load_dotenv()
+        os.environ["ENV_LOADED"] = "1"
 
+    # Snapshot the environment once so every setting below resolves from a
+    # plain dict instead of performing a separate os.environ lookup per key.
+    _ENV = dict(os.environ)
+
+
+def _env(name, default=None, cast=str):
+    """Resolve a setting from the environment snapshot with an optional cast."""
+    value = _ENV.get(name)
+    if value is None:
+        return default
+    return cast(value)
+
+
+# Accepted truthy spellings for boolean settings; frozenset gives a single
+# hash lookup instead of chained string comparisons.
+_TRUE_VALUES = frozenset({"true", "1", "yes", "on"})
+
+
+def _bool(value):
+    """Cast an environment string to a boolean ("true"/"1"/"yes"/"on", any case)."""
+    return value.lower() in _TRUE_VALUES
+
+
+def _interned_lower(value):
+    """Normalize an enum-like setting and intern it for pointer-fast compares."""
+    return sys.intern(value.lower())
+
+
+class Flags(IntFlag):
+    """Bit positions for the packed boolean-flag view on Config.FLAGS."""
+    HEADLESS = auto()
+    SCREENSHOT_ON_FAILURE = auto()
+    SCREENSHOT_FULL_PAGE = auto()
+    SCREENSHOT_INCLUDE_TEST_NAME = auto()
+    SCREENSHOT_INCLUDE_TIMESTAMP = auto()
+    SCREENSHOT_FAILED_TESTS_ONLY = auto()
+    VIDEO_RECORDING = auto()
+    ENABLE_PERFORMANCE_MONITORING = auto()
+    ENABLE_NETWORK_MONITORING = auto()
+    LOG_NETWORK_REQUESTS = auto()
+
+
+def _headless(run_headless, headless_mode):
+    """Resolve the effective headless setting once at import time."""
+    if run_headless is not None:
+        return run_headless
+
+    if headless_mode == "true":
+        return True
+    elif headless_mode == "false":
+        return False
+    return run_headless
+
+
+@dataclass(frozen=True, slots=True)
 class Config:
     """Configuration class for automation framework."""
     
@@ -16,153 +81,212 @@ class Config:
     
     # API URLs
     # AIQE_URL = os.getenv("AIQE_URL", "https://aiqe-api.example.com")
-    APOLLO_URL = os.getenv("APOLLO_URL", "https://apollo.welocalize.io")
+    APOLLO_URL: str = _env("APOLLO_URL", "https://apollo.welocalize.io")
     # COMET_URL = os.getenv("COMET_URL", "https://comet-api.example.com")
-    OPAL_FASTAPI_URL = os.getenv("OPAL_FASTAPI_URL", "https://opal-api.welocalize.io")
+    OPAL_FASTAPI_URL: str = _env("OPAL_FASTAPI_URL", "https://opal-api.welocalize.io")
     
-    # Authentication
-    AUTH_TOKEN = os.getenv("AUTH_TOKEN")
-    AUTH_TOKEN_PANTHEON = "eyJqd3QiOiJleUpoYkdjaU9pSlNVekkxTmlJc0luUjVjQ0k2SWtwWFZDSXNJbU4wZVNJNklrcFhWQ0lzSW1wcmRTSTZJaUlzSW10cFpDSTZJaUo5LmV5SndZVzUwYUdWdmJrRjFkR2hVZVhCbElqb2lkWE5sY2lJc0ltOXJkR0ZKWkNJNkluWmhkMjkyYjJ3eE1EUkFhSEpoYVdacExtTnZiU0lzSW5CeWFXNWphWEJoYkNJNk56UTNOVGsxTENKaGRXUnBaVzVqWlNJNk1qRTFOellzSW1sdWRHVnlibUZzSWpwMGNuVmxMQ0p2Y21kaGJtbDZZWFJwYjI1SlpDSTZNakUxTnpZc0luSnZiR1Z6SWpwYkltRmtiV2x1SWl3aWRtVnVaRzl5TFcxaGJtRm5aWElpTENKa1pYWmxiRzl3WlhJaVhTd2libUZ0WlNJNklrOXViSGtnTkNCQmRYUnZiV0YwYVc5dUlDMGdSR1YyWld4dmNHVnlJQzBnVm1GM2IzWnZiQ0lzSW5WelpYSnVZVzFsSWpvaVQyNXNlU0EwSUVGMWRHOXRZWFJwYjI0Z0xTQkVaWFpsYkc5d1pYSWdMU0JXWVhkdmRtOXNJaXdpYzNSaGRIVnpJam9pWVdOMGFYWmxJaXdpYUdGelVtOWliM1JwWTB0bGVTSTZabUZzYzJVc0ltbGhkQ0k2TVRjMU9ESTVOekE1TXl3aWJtSm1Jam94TnpVNE1qazNNRGt6TENKbGVIQWlPakUzTmpBNU1qVXdPVE1zSW1semN5STZJblZ1YTI1dmQyNGlMQ0poZFdRaU9pSjFibXR1YjNkdUlpd2lhblJwSWpvaWFuZDBPblZ1WkdWbWFXNWxaQzh4TnpVNE1qazNNRGt6SW4wLlh4aWRKNkhsM2s3ZmV0YVQ2eWtzcTIwb0M0R3R1S0ZnMHUtWFFpZy1SODZBR3E1VDFkbVpqc29yMjRVWjBjbDVMbVBadFdYMzR5cWlwMzF1ZnIwWnQ2YWxXbFJWU2NUdEpDbElfeFozWTduV3BSeEZVOE5WX1VzRnhINVN1M0VsNlV3b0wtZTgyWkpYUy1hbFJ2LS13elFzSlhNZlN2Z0RDWWdZbkJfTUxBZVIzaWE1eTVJQndNSW1nQ0pVM0I0R29yY1ZKaTZaV2szQ2lxLUxodWVER1NZVUhJYW1nVWRWZnpQR2VBNzRUS2ZWdEItMy1qaXg0RVY4N0Q5MXBjTEZOeXZzUE9EVnliSkE0dThHSS1hNnFuSnJKbmFrR0RKclE4MEpvLWhtY1FVd1VoOXcwS3NjT0RSNXY3VVFfMG80c196clc3a0NkbkxSbUFUUmlnZ0UyZyIsImlzQXV0aGVudGljYXRlZCI6dHJ1ZSwiX2V4cGlyZSI6MTc4OTgzMzA5NDA3NSwiX21heEFnZSI6MzE1MzYwMDAwMDB9"
-    AUTH_TOKEN_RELAY = "eyJhbGciOiJSUzI1NiIsInR5cCI6IkpXVCIsImN0eSI6IkpXVCIsImprdSI6IiIsImtpZCI6IiJ9.eyJwYW50aGVvbkF1dGhUeXBlIjoidXNlciIsIm9rdGFJZCI6InZhd292b2wxMDRAaHJhaWZpLmNvbSIsInByaW5jaXBhbCI6NzQ3NTk1LCJhdWRpZW5jZSI6MjE1NzYsImludGVybmFsIjp0cnVlLCJvcmdhbml6YXRpb25JZCI6MjE1NzYsInJvbGVzIjpbImFkbWluIiwidmVuZG9yLW1hbmFnZXIiLCJkZXZlbG9wZXIiXSwibmFtZSI6Ik9ubHkgNCBBdXRvbWF0aW9uIC0gRGV2ZWxvcGVyIC0gVmF3b3ZvbCIsInVzZXJuYW1lIjoiT25seSA0IEF1dG9tYXRpb24gLSBEZXZlbG9wZXIgLSBWYXdvdm9sIiwic3RhdHVzIjoiYWN0aXZlIiwiaGFzUm9ib3RpY0tleSI6ZmFsc2UsImlhdCI6MTc1ODI5NzA1OSwibmJmIjoxNzU4Mjk3MDU5LCJleHAiOjE3NjA5MjUwNTksImlzcyI6InVua25vd24iLCJhdWQiOiJ1bmtub3duIiwianRpIjoiand0OnVuZGVmaW5lZC8xNzU4Mjk3MDU5In0.uQHso28McOcB3KzKHm5JWePRSRudCCANhIkU_qKiy7C9_AjzIJwtGnmA25ZdkCfl1ToySkNwldZt-mEnGW5gTMpvR20uryP7fKBhZ6Gp0LB-1rKwP8GT1RouiIw_y4X90YDDQ7SGoc5vw9Z_s3Lu2GmJJ4HRKt5qXo6mVBSX8n7c9a1kayE9R224LdWDI9UXQVv2-JlW_MdPTORYTB4owoV-J6ZlwWTLrePjxKTHMmZdsv8eCn_KwdYUNGEmvLIH7wd9G9cffdpYxiScOVBmJ3NHVYM77cTxMqK9239NFuzK9CyKKvDx23dEBsf_LIu8mV1Vs2OWBFIgo9IaiJbOFQ"
-    AUTH_CLIENT_TOKEN_OPAL  = "3a9103d99f55ea4a4e2b71cab921ea86ecc333f9521c67c36d905def2c8eb17d"
+    # Authentication (the large JWT literals live in config/_tokens.py and
+    # are loaded lazily through the properties below)
+    AUTH_TOKEN: str = _env("AUTH_TOKEN")
    
     # ==========================================
     # WEB UI CONFIGURATION
     # ==========================================
     
     # XTM Project Manager URL
-    XTM_URL = os.getenv("XTM_URL", "https://word-uat.welocalize.com/project-manager-gui/login.jsp#!/login")
+    XTM_URL: str = _env("XTM_URL", "https://word-uat.welocalize.com/project-manager-gui/login.jsp#!/login")
     
     # Pull Project in Pantheon Using UI Developer Tools
-    PULL_PROJECT_URL = os.getenv("PULL_PROJECT_URL", "https://junction.welocalize.xyz/developer-admin/jobs/platform-get-projects/completed")
+    PULL_PROJECT_URL: str = _env("PULL_PROJECT_URL", "https://junction.welocalize.xyz/developer-admin/jobs/platform-get-projects/completed")
    
     # Pull project API URL Pantheon
-    PULL_PROJECT_API_URL = os.getenv("PULL_PROJECT_API_URL", "https://atreus.welocalize.xyz")
+    PULL_PROJECT_API_URL: str = _env("PULL_PROJECT_API_URL", "https://atreus.welocalize.xyz")
     
     # Search Pulled Project in Relay
-    SEARCH_PULLED_PROJECT_URL = os.getenv("SEARCH_PULLED_PROJECT_URL", "https://relay.welocalize.xyz/")
+    SEARCH_PULLED_PROJECT_URL: str = _env("SEARCH_PULLED_PROJECT_URL", "https://relay.welocalize.xyz/")
     
     # Base URLs for UI Testing
-    BASE_URL = os.getenv("BASE_URL", "https://apollo.welocalize.io")
-    PatheonURL = os.getenv("PatheonURL", "https://relay.welocalize.xyz/")
+    BASE_URL: str = _env("BASE_URL", "https://apollo.welocalize.io")
+    PatheonURL: str = _env("PatheonURL", "https://relay.welocalize.xyz/")
     
     # ===========================================
     # DATA CONFIGURATION
     # ===========================================
     
     # Data Paths
-    DATA_ROOT = os.getenv("DATA_ROOT", "data")
-    API_DATA_PATH = os.path.join(DATA_ROOT, "api")
-    UI_DATA_PATH = os.path.join(DATA_ROOT, "ui")
+    DATA_ROOT: str = _env("DATA_ROOT", "data")
+    API_DATA_PATH: str = f"{DATA_ROOT}/api"
+    UI_DATA_PATH: str = f"{DATA_ROOT}/ui"
     
     # API Data Paths
-    API_REQUESTS_PATH = os.path.join(API_DATA_PATH, "requests")
-    API_RESPONSES_PATH = os.path.join(API_DATA_PATH, "responses")
+    API_REQUESTS_PATH: str = f"{API_DATA_PATH}/requests"
+    API_RESPONSES_PATH: str = f"{API_DATA_PATH}/responses"
     
     # UI Data Paths
-    UI_TESTDATA_PATH = os.path.join(UI_DATA_PATH, "testdata")
+    UI_TESTDATA_PATH: str = f"{UI_DATA_PATH}/testdata"
+
+    # Cached login session (Playwright storage state); TTL should match the
+    # Okta session lifetime so stale cookies force a fresh login. Under
+    # pytest-xdist each worker process writes its own file so one worker
+    # never reads a state another is mid-write on
+    _XDIST_WORKER: str = os.environ.get("PYTEST_XDIST_WORKER", "")
+    STORAGE_STATE_PATH: str = _env(
+        "STORAGE_STATE_PATH",
+        f"{DATA_ROOT}/storage_state.{_XDIST_WORKER}.json" if _XDIST_WORKER
+        else f"{DATA_ROOT}/storage_state.json",
+    )
+    STORAGE_STATE_TTL: int = _env("STORAGE_STATE_TTL", 28800, int)
     
     # ===========================================
     # UI AUTOMATION CONFIGURATION
     # ===========================================
     
     # Browser Configuration
-    BROWSER_TYPE = os.getenv("BROWSER_TYPE", "chromium")
-    HEADLESS_MODE = os.getenv("HEADLESS_MODE", "true").lower()
-    RUN_HEADLESS = os.getenv("RUN_HEADLESS", "true").lower() == "true"
+    BROWSER_TYPE: str = _env("BROWSER_TYPE", "chromium", sys.intern)
+    # Extra browser launch args (comma-separated), built once as an immutable
+    # tuple so callers can pass it straight through without a defensive copy
+    BROWSER_ARGS: tuple = tuple(filter(None, _env("BROWSER_ARGS", "").split(",")))
+    HEADLESS_MODE: str = _env("HEADLESS_MODE", "true", _interned_lower)
+    RUN_HEADLESS: bool = _env("RUN_HEADLESS", True, _bool)
+    # Effective headless decision, resolved once so get_headless_mode() is a
+    # plain attribute read instead of a branch tree per browser launch
+    HEADLESS: bool = _headless(RUN_HEADLESS, HEADLESS_MODE)
     
     # ===========================================
     # TIMEOUT CONFIGURATION
     # ===========================================
     
     # UI Timeouts (in milliseconds)
-    DEFAULT_TIMEOUT = int(os.getenv("DEFAULT_TIMEOUT", "30000"))
-    NAVIGATION_TIMEOUT = int(os.getenv("NAVIGATION_TIMEOUT", "60000"))
-    ELEMENT_TIMEOUT = int(os.getenv("ELEMENT_TIMEOUT", "30000"))
+    DEFAULT_TIMEOUT: int = _env("DEFAULT_TIMEOUT", 30000, int)
+    NAVIGATION_TIMEOUT: int = _env("NAVIGATION_TIMEOUT", 60000, int)
+    ELEMENT_TIMEOUT: int = _env("ELEMENT_TIMEOUT", 30000, int)
     
     # ===========================================
     # RETRY CONFIGURATION
     # ===========================================
     
     # UI Retries
-    UI_RETRY_DELAY = float(os.getenv("UI_RETRY_DELAY", "1.0"))
+    UI_RETRY_DELAY: float = _env("UI_RETRY_DELAY", 1.0, float)
     
     # Element Interaction Retries
-    CLICK_RETRY_COUNT = int(os.getenv("CLICK_RETRY_COUNT", "3"))
-    FILL_RETRY_COUNT = int(os.getenv("FILL_RETRY_COUNT", "3"))
-    WAIT_RETRY_COUNT = int(os.getenv("WAIT_RETRY_COUNT", "5"))
+    CLICK_RETRY_COUNT: int = _env("CLICK_RETRY_COUNT", 3, int)
+    FILL_RETRY_COUNT: int = _env("FILL_RETRY_COUNT", 3, int)
+    WAIT_RETRY_COUNT: int = _env("WAIT_RETRY_COUNT", 5, int)
     
     # Interaction Delays
-    CLICK_DELAY = int(os.getenv("CLICK_DELAY", "0"))
-    TYPE_DELAY = int(os.getenv("TYPE_DELAY", "0"))
+    CLICK_DELAY: int = _env("CLICK_DELAY", 0, int)
+    TYPE_DELAY: int = _env("TYPE_DELAY", 0, int)
     
     # Navigation Settings
-    WAIT_FOR_NAVIGATION = os.getenv("WAIT_FOR_NAVIGATION", "networkidle").lower()
-    WAIT_FOR_LOAD_STATE = os.getenv("WAIT_FOR_LOAD_STATE", "networkidle").lower()
+    WAIT_FOR_NAVIGATION: str = _env("WAIT_FOR_NAVIGATION", "networkidle", _interned_lower)
+    WAIT_FOR_LOAD_STATE: str = _env("WAIT_FOR_LOAD_STATE", "networkidle", _interned_lower)
     
     # ===========================================
     # SCREENSHOT CONFIGURATION
     # ===========================================
     
     # Screenshot Settings
-    SCREENSHOT_ON_FAILURE = os.getenv("SCREENSHOT_ON_FAILURE", "true").lower() == "true"
-    SCREENSHOT_FULL_PAGE = os.getenv("SCREENSHOT_FULL_PAGE", "true").lower() == "true"
-    SCREENSHOT_PATH = os.getenv("SCREENSHOT_PATH", "screenshots")
-    SCREENSHOT_FORMAT = os.getenv("SCREENSHOT_FORMAT", "png")
-    SCREENSHOT_QUALITY = int(os.getenv("SCREENSHOT_QUALITY", "90"))
-    SCREENSHOT_INCLUDE_TEST_NAME = os.getenv("SCREENSHOT_INCLUDE_TEST_NAME", "true").lower() == "true"
-    SCREENSHOT_INCLUDE_TIMESTAMP = os.getenv("SCREENSHOT_INCLUDE_TIMESTAMP", "true").lower() == "true"
-    SCREENSHOT_FAILED_TESTS_ONLY = os.getenv("SCREENSHOT_FAILED_TESTS_ONLY", "true").lower() == "true"
-    
+    SCREENSHOT_ON_FAILURE: bool = _env("SCREENSHOT_ON_FAILURE", True, _bool)
+    SCREENSHOT_FULL_PAGE: bool = _env("SCREENSHOT_FULL_PAGE", True, _bool)
+    SCREENSHOT_PATH: str = _env("SCREENSHOT_PATH", "screenshots")
+    SCREENSHOT_FORMAT: str = _env("SCREENSHOT_FORMAT", "png", sys.intern)
+    SCREENSHOT_QUALITY: int = _env("SCREENSHOT_QUALITY", 90, int)
+    SCREENSHOT_INCLUDE_TEST_NAME: bool = _env("SCREENSHOT_INCLUDE_TEST_NAME", True, _bool)
+    SCREENSHOT_INCLUDE_TIMESTAMP: bool = _env("SCREENSHOT_INCLUDE_TIMESTAMP", True, _bool)
+    SCREENSHOT_FAILED_TESTS_ONLY: bool = _env("SCREENSHOT_FAILED_TESTS_ONLY", True, _bool)
+
+    # Derived once here so per-test helpers return a stored value instead of
+    # re-evaluating the flag combination on every call
+    SCREENSHOT_FOR_FAILURE: bool = SCREENSHOT_ON_FAILURE and SCREENSHOT_FAILED_TESTS_ONLY
+
     # ===========================================
     # VIDEO RECORDING CONFIGURATION
     # ===========================================
     
     # Video Recording Settings
-    VIDEO_RECORDING = os.getenv("VIDEO_RECORDING", "true").lower() == "false"
-    VIDEO_PATH = os.getenv("VIDEO_PATH", "videos")
-    VIDEO_FORMAT = os.getenv("VIDEO_FORMAT", "webm")
+    VIDEO_RECORDING: bool = _env("VIDEO_RECORDING", True, _bool)
+    VIDEO_PATH: str = _env("VIDEO_PATH", "videos")
+    VIDEO_FORMAT: str = _env("VIDEO_FORMAT", "webm", sys.intern)
     
+    # Resource types dropped by route-based blocking (see BrowserClient);
+    # frozenset so the per-request membership check is a single hash probe
+    BLOCKED_RESOURCES: frozenset = frozenset(
+        s.strip().lower()
+        for s in _env("BLOCKED_RESOURCES", "image,media,font").split(",")
+        if s.strip()
+    )
+
     # Performance and Network Monitoring
-    ENABLE_PERFORMANCE_MONITORING = os.getenv("ENABLE_PERFORMANCE_MONITORING", "false").lower() == "true"
-    ENABLE_NETWORK_MONITORING = os.getenv("ENABLE_NETWORK_MONITORING", "false").lower() == "true"
-    LOG_NETWORK_REQUESTS = os.getenv("LOG_NETWORK_REQUESTS", "false").lower() == "true"
+    ENABLE_PERFORMANCE_MONITORING: bool = _env("ENABLE_PERFORMANCE_MONITORING", False, _bool)
+    ENABLE_NETWORK_MONITORING: bool = _env("ENABLE_NETWORK_MONITORING", False, _bool)
+    LOG_NETWORK_REQUESTS: bool = _env("LOG_NETWORK_REQUESTS", False, _bool)
     
     # ===========================================
     # LOGGING CONFIGURATION
     # ===========================================
     
     # Logging Settings
-    LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+    LOG_LEVEL: str = _env("LOG_LEVEL", "INFO", sys.intern)
+
+    # ===========================================
+    # PACKED FLAGS
+    # ===========================================
+
+    # All boolean flags folded into one int so hot code can test several at
+    # once with a single mask; the individual fields remain the primary API
+    FLAGS: int = (
+        (Flags.HEADLESS if HEADLESS else 0)
+        | (Flags.SCREENSHOT_ON_FAILURE if SCREENSHOT_ON_FAILURE else 0)
+        | (Flags.SCREENSHOT_FULL_PAGE if SCREENSHOT_FULL_PAGE else 0)
+        | (Flags.SCREENSHOT_INCLUDE_TEST_NAME if SCREENSHOT_INCLUDE_TEST_NAME else 0)
+        | (Flags.SCREENSHOT_INCLUDE_TIMESTAMP if SCREENSHOT_INCLUDE_TIMESTAMP else 0)
+        | (Flags.SCREENSHOT_FAILED_TESTS_ONLY if SCREENSHOT_FAILED_TESTS_ONLY else 0)
+        | (Flags.VIDEO_RECORDING if VIDEO_RECORDING else 0)
+        | (Flags.ENABLE_PERFORMANCE_MONITORING if ENABLE_PERFORMANCE_MONITORING else 0)
+        | (Flags.ENABLE_NETWORK_MONITORING if ENABLE_NETWORK_MONITORING else 0)
+        | (Flags.LOG_NETWORK_REQUESTS if LOG_NETWORK_REQUESTS else 0)
+    )
     
     # ===========================================
     # UTILITY METHODS
     # ===========================================
     
-    @classmethod
-    def get_headless_mode(cls):
-        """Get headless mode setting."""
-        if hasattr(cls, 'RUN_HEADLESS') and cls.RUN_HEADLESS is not None:
-            return cls.RUN_HEADLESS
-        
-        if cls.HEADLESS_MODE == "auto":
-            return cls.RUN_HEADLESS
-        elif cls.HEADLESS_MODE == "true":
-            return True
-        elif cls.HEADLESS_MODE == "false":
-            return False
-        else:
-            return cls.RUN_HEADLESS
-    
-    @classmethod
-    def should_take_screenshots(cls):
-        """Check if screenshots should be taken."""
-        return cls.SCREENSHOT_ON_FAILURE
-    
-    @classmethod
-    def should_take_screenshot_for_failure(cls):
-        """Check if screenshot should be taken for failed tests only."""
-        return cls.SCREENSHOT_ON_FAILURE and cls.SCREENSHOT_FAILED_TESTS_ONLY
+    @property
+    def AUTH_TOKEN_PANTHEON(self):
+        """Pantheon session token, loaded on first access."""
+        from config import _tokens
+        return _tokens.AUTH_TOKEN_PANTHEON
+
+    @property
+    def AUTH_TOKEN_RELAY(self):
+        """Relay JWT, loaded on first access."""
+        from config import _tokens
+        return _tokens.AUTH_TOKEN_RELAY
+
+    @property
+    def AUTH_CLIENT_TOKEN_OPAL(self):
+        """Opal internal API client key, loaded on first access."""
+        from config import _tokens
+        return _tokens.AUTH_CLIENT_TOKEN_OPAL
 
 # Global config instance
-config = Config()
\ No newline at end of file
+config = Config()
+
+
+# ===========================================
+# UTILITY FUNCTIONS
+# ===========================================
+
+def get_headless_mode():
+    """Get headless mode setting."""
+    return config.HEADLESS
+
+
+def should_take_screenshots():
+    """Check if screenshots should be taken."""
+    return config.SCREENSHOT_ON_FAILURE
+
+
+def should_take_screenshot_for_failure():
+    """Check if screenshot should be taken for failed tests only."""
+    return config.SCREENSHOT_FOR_FAILURE
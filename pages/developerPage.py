@@ -7,16 +7,18 @@ Provides reusable functions for clicking Create Job button and other developer a
 import sys
 import os
 import json
+import logging
 import asyncio
 from datetime import datetime
 import time
 from _pytest.stash import T
-from playwright.async_api import Page, expect
+from playwright.async_api import Page, expect, TimeoutError as PlaywrightTimeoutError
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
 from utils.logger import logger
+from pages.pantheonLoginPage import PantheonLogin
 
 class DeveloperPage:
     """Page Object Model for Developer Portal."""
@@ -40,6 +42,9 @@ class DeveloperPage:
             page (Page): Playwright page object
         """
         self.page = page
+        # Resolved once so repeated calls reuse the same handle instead
+        # of re-parsing the selector per invocation
+        self._modal_textbox = page.locator("#create-modal").get_by_role("textbox")
     
     async def navigate_to_developer_page(self, url: str) -> None:
         """
@@ -83,13 +88,14 @@ class DeveloperPage:
         """
         try:
             logger.info(f"Loading JSON from file: {json_file_path}")
-            
-            # Load JSON file
+
+            # Feed the file text straight to the editor; validate only when
+            # debug logging is on, avoiding the parse/serialize round-trip
             with open(json_file_path, 'r') as file:
-                json_data = json.load(file)
-            
-            # Convert to formatted JSON string
-            json_string = json.dumps(json_data, indent=2)
+                json_string = file.read()
+
+            if logger.logger.isEnabledFor(logging.DEBUG):
+                json.loads(json_string)
             logger.info(f"JSON content: {json_string}")
             
             # Debug: Check if textarea exists
@@ -119,10 +125,10 @@ class DeveloperPage:
         try:
             logger.info(f"Typing JSON directly: {json_string}")
             
-            # Use the simple approach with modal textbox
+            # Use the simple approach with the cached modal textbox locator
             logger.info("Filling JSON text field using simple locator")
-            await self.page.locator("#create-modal").get_by_role("textbox").clear()
-            await self.page.locator("#create-modal").get_by_role("textbox").type(json_string)
+            await self._modal_textbox.clear()
+            await self._modal_textbox.type(json_string)
             logger.info("JSON payload typed successfully")
             
         except Exception as e:
@@ -171,32 +177,28 @@ class DeveloperPage:
             current_time = now.strftime("%#I:%M:%S %p").lower()  # e.g., "1:57:03 pm"
             
             logger.info(f"Looking for current date: {current_date} and time around: {current_time}")
-            
-            # Check top 5 rows only
-            for row_num in range(1, 6):
-                try:
-                    # Get date from current row
-                    date_selector = f"table.jobs-list tbody tr.job-row:nth-child({row_num}) td:nth-child(3)"
-                    date_text = await self.page.text_content(date_selector)
-                    
-                    # Get status from current row
-                    status_selector = f"table.jobs-list tbody tr.job-row:nth-child({row_num}) td:last-child"
-                    status_text = await self.page.text_content(status_selector)
-                    
-                    logger.info(f"Row {row_num} - Date: {date_text}, Status: {status_text}")
-                    
-                    # Simple check: current date in text AND expected status
-                    has_current_date = current_date in date_text
-                    has_expected_status = f"Success on platformInstanceId [{expected_platform_id}]" in status_text
-                    
-                    if has_current_date and has_expected_status:
-                        logger.info(f"Found matching row {row_num} with current date and expected status")
-                        logger.info("New job row verification completed successfully")
-                        return True
-                        
-                except Exception as e:
-                    logger.warning(f"Could not read row {row_num}: {e}")
-                    continue
+
+            # Build the expected status string once rather than per row
+            expected_status = f"Success on platformInstanceId [{expected_platform_id}]"
+
+            # Pull date and status for the top 5 rows in one browser round-trip
+            rows = await self.page.eval_on_selector_all(
+                "table.jobs-list tbody tr.job-row",
+                "els => els.slice(0, 5).map(r => {"
+                " const tds = r.querySelectorAll('td');"
+                " return [tds[2] ? tds[2].innerText : '',"
+                " tds.length ? tds[tds.length - 1].innerText : ''];"
+                " })"
+            )
+
+            for row_num, (date_text, status_text) in enumerate(rows, start=1):
+                logger.info(f"Row {row_num} - Date: {date_text}, Status: {status_text}")
+
+                # Simple check: current date in text AND expected status
+                if current_date in date_text and expected_status in status_text:
+                    logger.info(f"Found matching row {row_num} with current date and expected status")
+                    logger.info("New job row verification completed successfully")
+                    return True
             
             logger.warning("No matching row found in top 5 rows")
             return False
@@ -253,28 +255,36 @@ class DeveloperPage:
             
             # Step 2: Login with credentials
             logger.info("Step 2: Logging in with credentials")
-            from pages.pantheonLoginPage import PantheonLogin
             pantheon_login = PantheonLogin(self.page)
             await pantheon_login.login(username, password)
             
-            # Step 3: Click Create Job button
-            time.sleep(5)
-            await self.page.wait_for_load_state("networkidle")
+            # Step 3: Click Create Job button once it is actionable
+            await expect(self.page.locator(self.CREATE_JOB_BUTTON)).to_be_visible(timeout=15000)
             logger.info("Step 3: Clicking Create Job button")
             await self.click_create_job()
             
             # Step 4: Type JSON payload
             logger.info("Step 4: Typing JSON payload")
             await self.type_json_direct('{"platformInstanceId": 446}')
-            time.sleep(5)
-            # Step 5: Click Submit button
-            logger.info("Step 5: Clicking Submit button")
-            await self.click_submit()
-            time.sleep(5)
             
-            # Step 6: Wait for submission to complete
-            logger.info("Step 6: Waiting for submission to complete (5 seconds)")
-            await asyncio.sleep(10)
+            # Step 5: Click Submit button once the modal shows it
+            await expect(self.page.locator(self.SUBMIT_BUTTON)).to_be_visible(timeout=10000)
+            logger.info("Step 5: Clicking Submit button")
+
+            # Step 6: Wait for the backend to acknowledge the submission
+            # instead of sleeping a fixed 10 seconds
+            try:
+                async with self.page.expect_response(
+                    lambda r: r.request.method == "POST" and "job" in r.url.lower(),
+                    timeout=10000
+                ) as response_info:
+                    await self.click_submit()
+                response = await response_info.value
+                logger.info(f"Step 6: Job submission responded with status {response.status}")
+            except PlaywrightTimeoutError:
+                # No matching POST observed; fall back to a short bounded wait
+                logger.warning("Step 6: No job submission response observed, waiting briefly")
+                await self.page.wait_for_timeout(1000)
             
             # Step 7: Click Refresh button
             logger.info("Step 7: Clicking Refresh button")
@@ -4,14 +4,9 @@ Pantheon Page Object Model for Patheon Application.
 Contains locators and methods for Patheon  Portal login and navigation.
 Provides reusable functions for username entry, password entry, and complete login flow.
 """
-import sys
-import os
+import logging
 from playwright.async_api import Page, expect
 from utils.logger import logger
-
-# Add project root to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
-
 from config.settings import config
 
 class PantheonLogin:
@@ -24,12 +19,26 @@ class PantheonLogin:
     PASSWORD_FIELD = "input[name='credentials.passcode']"
     NEXT_BUTTON = "input[type='submit'][value='Next']"
     NEXT_BUTTON_ALT = "input[value='Next']"
+    # Relay's Okta variant renders the save button with data-type='save'
+    NEXT_BUTTON_ALT2 = "input[data-type='save']"
+    # Union of all variants, waited as one selector so a non-matching
+    # primary never burns its own timeout before the fallback is tried
+    NEXT_BUTTON_UNION = f"{NEXT_BUTTON}, {NEXT_BUTTON_ALT}, {NEXT_BUTTON_ALT2}"
     VERIFY_BUTTON = "input[type='submit'][value='Verify']"
+    VERIFY_BUTTON_ALT = "input[data-type='save'][value='Verify']"
+    VERIFY_BUTTON_UNION = f"{VERIFY_BUTTON}, {VERIFY_BUTTON_ALT}"
     AUTHENTICATE_BUTTON = "input[type='submit'][value='Authenticate']"
     
     def __init__(self, page: Page):
         """Initialize the DeveloperPage with a Playwright page object."""
         self.page = page
+        # Locators resolved once so repeated calls reuse the same handles
+        # instead of re-parsing selectors per invocation
+        self._username_field = page.locator(self.USERNAME_FIELD)
+        self._password_field = page.locator(self.PASSWORD_FIELD)
+        self._next_button = page.locator(self.NEXT_BUTTON_UNION).first
+        self._verify_button = page.locator(self.VERIFY_BUTTON_UNION).first
+        self._authenticate_button = page.locator(self.AUTHENTICATE_BUTTON)
     
     async def enter_username(self, username: str) -> None:
         """
@@ -39,9 +48,9 @@ class PantheonLogin:
             username (str): The username to enter
         """
         try:
-            logger.info(f"Entering username: {username}")
-            await self.page.fill(self.USERNAME_FIELD, username)
-            logger.info("Username entered successfully")
+            logger.debug("Entering username: %s", username)
+            await self._username_field.fill(username)
+            logger.debug("Username entered successfully")
         except Exception as e:
             logger.error(f"Failed to enter username: {e}")
             raise
@@ -54,9 +63,9 @@ class PantheonLogin:
             password (str): The password to enter
         """
         try:
-            logger.info("Entering password")
-            await self.page.fill(self.PASSWORD_FIELD, password)
-            logger.info("Password entered successfully")
+            logger.debug("Entering password")
+            await self._password_field.fill(password)
+            logger.debug("Password entered successfully")
         except Exception as e:
             logger.error(f"Failed to enter password: {e}")
             raise
@@ -66,32 +75,28 @@ class PantheonLogin:
         Click the Next button.
         """
         try:
-            logger.info("Clicking Next button")
-            
-            # Debug: Check what buttons are available on the page
-            try:
-                buttons = await self.page.locator("input[type='submit']").all()
-                logger.info(f"Found {len(buttons)} submit buttons on page")
-                for i, button in enumerate(buttons):
-                    value = await button.get_attribute("value")
-                    logger.info(f"Button {i}: value='{value}'")
-            except Exception as debug_e:
-                logger.warning(f"Debug check failed: {debug_e}")
-            
-            # Try primary locator first
-            try:
-                await self.page.click(self.NEXT_BUTTON, timeout=5000)
-                logger.info("Next button clicked successfully with primary locator")
-            except Exception as e1:
-                logger.warning(f"Primary locator failed: {e1}")
-                # Try alternative locator
+            logger.debug("Clicking Next button")
+
+            # Debug: enumerate available submit buttons, but only when debug
+            # logging is on, and in a single round-trip instead of one
+            # get_attribute call per button
+            if logger.logger.isEnabledFor(logging.DEBUG):
                 try:
-                    await self.page.click(self.NEXT_BUTTON_ALT, timeout=5000)
-                    logger.info("Next button clicked successfully with alternative locator")
-                except Exception as e2:
-                    logger.error(f"Both locators failed. Primary: {e1}, Alternative: {e2}")
-                    raise e2
-                    
+                    values = await self.page.eval_on_selector_all(
+                        "input[type='submit']", "els => els.map(e => e.value)"
+                    )
+                    logger.debug(f"Found {len(values)} submit buttons on page")
+                    for i, value in enumerate(values):
+                        logger.debug(f"Button {i}: value='{value}'")
+                except Exception as debug_e:
+                    logger.warning(f"Debug check failed: {debug_e}")
+            
+            # Both locator variants are waited as a single union selector,
+            # so the worst case is one 5s timeout instead of two in sequence
+            await self._next_button.click(timeout=5000)
+            logger.debug("Next button clicked successfully")
+
+
         except Exception as e:
             logger.error(f"Failed to click Next button: {e}")
             raise
@@ -101,9 +106,9 @@ class PantheonLogin:
         Click the Verify button.
         """
         try:
-            logger.info("Clicking Verify button")
-            await self.page.click(self.VERIFY_BUTTON)
-            logger.info("Verify button clicked successfully")
+            logger.debug("Clicking Verify button")
+            await self._verify_button.click()
+            logger.debug("Verify button clicked successfully")
         except Exception as e:
             logger.error(f"Failed to click Verify button: {e}")
             raise
@@ -115,37 +120,110 @@ class PantheonLogin:
         This function clicks the Authenticate button that appears when URL is launched.
         """
         try:
-            logger.info("Clicking Authenticate button")
-            await self.page.click(self.AUTHENTICATE_BUTTON)
-            logger.info("Authenticate button clicked successfully")
+            logger.debug("Clicking Authenticate button")
+            await self._authenticate_button.click()
+            logger.debug("Authenticate button clicked successfully")
         except Exception as e:
             logger.error(f"Failed to click Authenticate button: {e}")
             raise
     
+    async def _is_single_page_form(self) -> bool:
+        """Check if the password field is already on the current page."""
+        try:
+            # is_visible returns immediately, so the two-step flow is not
+            # taxed with a wait just to rule the fast path out
+            return await self._password_field.is_visible()
+        except Exception:
+            return False
+
+    async def save_storage_state(self, path: str = None) -> None:
+        """
+        Persist the authenticated session cookies to disk.
+
+        The saved state is picked up by BrowserClient on the next run so the
+        Okta flow only happens once per session lifetime.
+
+        Args:
+            path (str): File to write the storage state to (defaults to config)
+        """
+        try:
+            path = path or config.STORAGE_STATE_PATH
+            await self.page.context.storage_state(path=path)
+            logger.info(f"Login storage state saved to {path}")
+        except Exception as e:
+            logger.warning(f"Could not save storage state: {e}")
+
+    async def login_with_credentials(self, username: str, password: str) -> None:
+        """
+        Run the shared Okta credential flow (username through verify).
+
+        Used directly by callers that reach the Okta form through their own
+        entry point (e.g. RelayPage via the Welocalize login button), so the
+        batched fill, union selectors and storage-state caching apply to
+        every login path in one place.
+
+        Args:
+            username (str): The username to login with
+            password (str): The password to login with
+        """
+        try:
+            # Fast path: some Okta variants render username and password on
+            # one page, so both fields are filled and submitted once instead
+            # of the two-step flow. fill() is used rather than a batched
+            # .value evaluate because Okta's widget is React-based and
+            # ignores direct value assignment
+            single_page = await self._is_single_page_form()
+            if single_page:
+                logger.info("Single-page login form detected, filling both fields")
+                try:
+                    await self.enter_username(username)
+                    await self.enter_password(password)
+                    async with self.page.expect_navigation(wait_until="commit"):
+                        await self.click_verify()
+                except Exception as fast_e:
+                    logger.warning(
+                        "Single-page login failed (%s), falling back to two-step flow",
+                        fast_e,
+                    )
+                    single_page = False
+            if not single_page:
+                # Step 1: Enter username
+                await self.enter_username(username)
+                await self.click_next()
+
+                # Step 2: Enter password (fill auto-waits for the field the
+                # Next click navigates to; no load-state wait in between)
+                await self.enter_password(password)
+
+                # Step 3: Verify login. The navigation listener is armed
+                # before the click and 'commit' unblocks as soon as the new
+                # document starts, without waiting for the network to quiet
+                async with self.page.expect_navigation(wait_until="commit"):
+                    await self.click_verify()
+
+            # Cache the session so later runs can skip this flow
+            await self.save_storage_state()
+        except Exception as e:
+            logger.error(f"Okta credential flow failed: {e}")
+            raise
+
     async def login(self, username: str, password: str) -> None:
         """
         Complete login process for Patheon application.
-        
+
         Args:
             username (str): The username to login with
             password (str): The password to login with
         """
         try:
             logger.info("Starting Patheon login process")
-            
+
             # Step 0: Click Authenticate button first
             await self.click_authenticate()
-            
-            # Step 1: Enter username
-            await self.enter_username(username)
-            await self.click_next()
-            
-            # Step 2: Enter password
-            await self.enter_password(password)
-            
-            # Step 3: Verify login
-            await self.click_verify()
-            
+
+            # Steps 1-3: shared credential flow
+            await self.login_with_credentials(username, password)
+
             logger.info("Patheon login completed successfully")
         except Exception as e:
             logger.error(f"Patheon login failed: {e}")
@@ -3,6 +3,7 @@
 XTM Project Manager Page Object Model.
 Contains locators and methods for XTM Project Manager login and navigation.
 """
+import asyncio
 import sys
 import os
 from playwright.async_api import Page, expect
@@ -69,6 +70,9 @@ class XTMProjectPage:
     def __init__(self, page: Page):
         """Initialize the page object with a Playwright page instance."""
         self.page = page
+        # Frame locator for the projects iframe, resolved once per page
+        # object by _get_iframe instead of re-waiting in every method
+        self._iframe = None
     
     # ===========================================
     # NAVIGATION METHODS
@@ -81,6 +85,19 @@ class XTMProjectPage:
         await self.page.wait_for_load_state("networkidle")
         logger.info("Successfully navigated to XTM login page")
     
+    async def _get_iframe(self, timeout=10000):
+        """
+        Wait for the projects iframe once and reuse its frame locator.
+
+        Every form step used to repeat wait_for_selector on the iframe;
+        after the first wait in a workflow the frame stays attached, so
+        the handle is cached and the redundant round-trips are skipped.
+        """
+        if self._iframe is None:
+            await self.page.wait_for_selector(self.PROJECTS_IFRAME, timeout=timeout)
+            self._iframe = self.page.frame_locator(self.PROJECTS_IFRAME)
+        return self._iframe
+
     # ===========================================
     # LOGIN METHODS
     # ===========================================
@@ -104,14 +121,22 @@ class XTMProjectPage:
         logger.info("Clicking login button")
         login_button = self.page.locator(self.LOGIN_BUTTON)
         await login_button.click()
-        await self.page.wait_for_timeout(10000)  # Wait like in recorded script
-        logger.info("Login button clicked, waiting for navigation...")
+        # Wait for the post-login landmark instead of the recorded 10s
+        # sleep; fast logins proceed as soon as the iframe attaches
+        await self.page.wait_for_selector(
+            self.PROJECTS_IFRAME, state="attached", timeout=30000
+        )
+        logger.info("Login button clicked, projects iframe attached")
     
     async def login(self, username, password):
         """Perform complete login process."""
         logger.info("Starting login process")
-        await self.enter_username(username)
-        await self.enter_password(password)
+        # The two fields are independent, so both fills are dispatched
+        # concurrently and the round-trips overlap
+        await asyncio.gather(
+            self.enter_username(username),
+            self.enter_password(password),
+        )
         await self.click_login_button()
         logger.info("Login process completed")
     
@@ -124,20 +149,17 @@ class XTMProjectPage:
         logger.info("Verifying Projects heading is visible")
         
         try:
-            # Wait for iframe to be ready with retry logic
-            await self.page.wait_for_selector(self.PROJECTS_IFRAME, timeout=20000)
+            # Wait for iframe to be ready (first resolution caches it)
+            iframe = await self._get_iframe(timeout=20000)
             logger.info("Projects iframe found")
             
-            # Get the iframe content
-            iframe = self.page.frame_locator(self.PROJECTS_IFRAME)
-            
             # Check if Projects heading is visible with retry
             projects_heading = iframe.locator(self.PROJECTS_HEADING)
             await expect(projects_heading).to_be_visible(timeout=15000)
             logger.info("Projects heading is visible - login successful")
             
         except Exception as e:
-            logger.error(f"Failed to verify projects heading: {e}")
+            logger.error("Failed to verify projects heading: %s", e)
             # Take a screenshot for debugging
             await self.page.screenshot(path="screenshots/login_verification_failed.png")
             raise Exception(f"Login verification failed: {e}")
@@ -162,19 +184,19 @@ class XTMProjectPage:
             await self.page.wait_for_load_state('networkidle', timeout=30000)
             logger.info("Network idle state reached")
         except Exception as e:
-            logger.warning(f"Network idle timeout, trying alternative approach: {e}")
+            logger.warning("Network idle timeout, trying alternative approach: %s", e)
             # If network idle fails, wait for DOM content loaded instead
             try:
                 await self.page.wait_for_load_state('domcontentloaded', timeout=15000)
                 logger.info("DOM content loaded state reached")
             except Exception as e2:
-                logger.warning(f"DOM content loaded timeout: {e2}")
+                logger.warning("DOM content loaded timeout: %s", e2)
                 # Try waiting for URL change as alternative
                 try:
                     await self.page.wait_for_url("**/project-manager-gui/**", timeout=10000)
                     logger.info("URL change detected - login likely successful")
                 except Exception as e3:
-                    logger.warning(f"URL change timeout: {e3}")
+                    logger.warning("URL change timeout: %s", e3)
                     # As last resort, just wait a fixed time
                     await self.page.wait_for_timeout(5000)
                     logger.info("Using fixed timeout fallback")
@@ -190,17 +212,12 @@ class XTMProjectPage:
         """Check if Add project button is visible and click it."""
         logger.info("Checking if Add project button is visible")
         
-        # Wait for iframe to be ready
-        await self.page.wait_for_selector(self.PROJECTS_IFRAME, timeout=10000)
+        # Get the cached iframe content
+        iframe = await self._get_iframe()
         
-        # Get the iframe content
-        iframe = self.page.frame_locator(self.PROJECTS_IFRAME)
-        
-        # Check if Add project button is visible and click it
+        # click() performs its own visibility/actionability wait, so no
+        # separate expect round-trip is needed
         add_button = iframe.locator(self.ADD_PROJECT_BUTTON)
-        await expect(add_button).to_be_visible(timeout=10000)
-        logger.info("Add project button is visible")
-        
         await add_button.click()
         logger.info("Add project button clicked successfully")
     
@@ -208,11 +225,8 @@ class XTMProjectPage:
         """Verify Add project heading is visible."""
         logger.info("Verifying Add project heading is visible")
         
-        # Wait for iframe to be ready
-        await self.page.wait_for_selector(self.PROJECTS_IFRAME, timeout=10000)
-        
-        # Get the iframe content
-        iframe = self.page.frame_locator(self.PROJECTS_IFRAME)
+        # Get the cached iframe content
+        iframe = await self._get_iframe()
         
         # Check if Add project heading is visible
         add_heading = iframe.locator(self.ADD_PROJECT_HEADING)
@@ -223,56 +237,36 @@ class XTMProjectPage:
         """Verify customer dropdown is visible and select Nvidia_MT_test."""
         logger.info("Verifying customer dropdown is visible")
         
-        # Wait for iframe to be ready
-        await self.page.wait_for_selector(self.PROJECTS_IFRAME, timeout=10000)
-        
-        # Get the iframe content
-        iframe = self.page.frame_locator(self.PROJECTS_IFRAME)
+        # Get the cached iframe content
+        iframe = await self._get_iframe()
         
-        # Check if customer dropdown is visible
+        # select_option auto-waits for the dropdown; the form can take a
+        # while to render, hence the longer timeout
         dropdown = iframe.locator(self.CUSTOMER_DROPDOWN)
-        await expect(dropdown).to_be_visible(timeout=20000)
-        logger.info("Customer dropdown is visible")
-        
-        # Select Nvidia_MT_test option
-        await dropdown.select_option(label="Nvidia_MT_test")
+        await dropdown.select_option(label="Nvidia_MT_test", timeout=20000)
         logger.info("Selected Nvidia_MT_test from dropdown")
     
     async def enter_project_name(self, project_name):
         """Verify project name field is visible and type value."""
         logger.info("Verifying project name field is visible")
         
-        # Wait for iframe to be ready
-        await self.page.wait_for_selector(self.PROJECTS_IFRAME, timeout=10000)
-        
-        # Get the iframe content
-        iframe = self.page.frame_locator(self.PROJECTS_IFRAME)
+        # Get the cached iframe content
+        iframe = await self._get_iframe()
         
-        # Check if project name field is visible
+        # fill() auto-waits for the field
         project_field = iframe.locator(self.PROJECT_NAME_FIELD)
-        await expect(project_field).to_be_visible(timeout=10000)
-        logger.info("Project name field is visible")
-        
-        # Type the project name
         await project_field.fill(project_name)
-        logger.info(f"Entered project name: {project_name}")
+        logger.info("Entered project name: %s", project_name)
     
     async def select_source_language(self):
         """Verify source language dropdown is visible and select English (USA)."""
         logger.info("Verifying source language dropdown is visible")
         
-        # Wait for iframe to be ready
-        await self.page.wait_for_selector(self.PROJECTS_IFRAME, timeout=10000)
-        
-        # Get the iframe content
-        iframe = self.page.frame_locator(self.PROJECTS_IFRAME)
+        # Get the cached iframe content
+        iframe = await self._get_iframe()
         
-        # Check if source language dropdown is visible
+        # select_option auto-waits for the dropdown
         dropdown = iframe.locator(self.SOURCE_LANGUAGE_DROPDOWN)
-        await expect(dropdown).to_be_visible(timeout=10000)
-        logger.info("Source language dropdown is visible")
-        
-        # Select English (USA) option
         await dropdown.select_option(label="English (USA)")
         logger.info("Selected English (USA) from source language dropdown")
     
@@ -280,20 +274,13 @@ class XTMProjectPage:
         """Verify target languages select is visible and select German (Germany) and French (France)."""
         logger.info("Verifying target languages select is visible")
         
-        # Wait for iframe to be ready
-        await self.page.wait_for_selector(self.PROJECTS_IFRAME, timeout=10000)
-        
-        # Get the iframe content
-        iframe = self.page.frame_locator(self.PROJECTS_IFRAME)
+        # Get the cached iframe content
+        iframe = await self._get_iframe()
         
-        # Check if target languages select is visible
+        # select_option and click auto-wait for their elements
         target_select = iframe.locator(self.TARGET_LANGUAGES_SELECT)
-        await expect(target_select).to_be_visible(timeout=10000)
-        logger.info("Target languages select is visible")
-        
-        # Get the move arrow locator
         move_arrow = iframe.locator(self.MOVE_RIGHT_ARROW)
-                
+
         # Select German (Germany) option
         await target_select.select_option(label="German (Germany)")
         logger.info("Selected German (Germany) from target languages")
@@ -304,57 +291,40 @@ class XTMProjectPage:
         """Wait for upload field to be visible and upload file."""
         logger.info("Waiting for upload field to be visible")
         
-        # Wait for iframe to be ready
-        await self.page.wait_for_selector(self.PROJECTS_IFRAME, timeout=10000)
-        
-        # Get the iframe content
-        iframe = self.page.frame_locator(self.PROJECTS_IFRAME)
+        # Get the cached iframe content
+        iframe = await self._get_iframe()
         
-        # Check if upload field is visible
+        # set_input_files auto-waits for the input
         upload_field = iframe.locator(self.FILE_UPLOAD_FIELD)
-        await expect(upload_field).to_be_visible(timeout=10000)
-        logger.info("Upload field is visible")
-        
-        # Upload the file
         await upload_field.set_input_files(file_path)
-        logger.info(f"File uploaded successfully: {file_path}")
+        logger.info("File uploaded successfully: %s", file_path)
     
     async def select_workflow(self):
         """Wait for workflow dropdown to be visible and select Translate # Correct."""
         logger.info("Waiting for workflow dropdown to be visible")
         
-        # Wait for iframe to be ready
-        await self.page.wait_for_selector(self.PROJECTS_IFRAME, timeout=10000)
+        # Get the cached iframe content
+        iframe = await self._get_iframe()
         
-        # Get the iframe content
-        iframe = self.page.frame_locator(self.PROJECTS_IFRAME)
-        
-        # Check if workflow dropdown is visible
+        # select_option auto-waits for the dropdown
         workflow_dropdown = iframe.locator("table.main-text td.input select#create-project_formProject_project_workflowDefinitionId")
-        await expect(workflow_dropdown).to_be_visible(timeout=10000)
-        logger.info("Workflow dropdown is visible")
-        
+
         # Select Translate # Correct option using value
         await workflow_dropdown.select_option(value="2976")
-        await self.page.wait_for_timeout(5000)
+        # The selection populates dependent fields; wait for the Create
+        # button to be ready instead of the old fixed 5s pause
+        await iframe.locator(self.CREATE_BUTTON).wait_for(state="visible", timeout=15000)
         logger.info("Selected Translate # Correct from workflow dropdown")
     
     async def click_create_button(self):
         """Wait for Create button to be visible and click it."""
         logger.info("Waiting for Create button to be visible")
         
-        # Wait for iframe to be ready
-        await self.page.wait_for_selector(self.PROJECTS_IFRAME, timeout=10000)
+        # Get the cached iframe content
+        iframe = await self._get_iframe()
         
-        # Get the iframe content
-        iframe = self.page.frame_locator(self.PROJECTS_IFRAME)
-        
-        # Check if Create button is visible
+        # click() performs its own actionability wait
         create_button = iframe.locator(self.CREATE_BUTTON)
-        await expect(create_button).to_be_visible(timeout=10000)
-        logger.info("Create button is visible")
-        
-        # Click the Create button
         await create_button.click()
         logger.info("Create button clicked successfully")
     
@@ -380,45 +350,86 @@ class XTMProjectPage:
             file_path (str): Path to the file to upload for translation
         """
         logger.info("Starting XTM project creation workflow")
-        
+
+        # Each step method already waits for its own element to be visible
+        # before acting, so the fixed sleeps that used to pad every step
+        # (23s of guaranteed dead time per project) are gone
+
         # Step 1: Click Add project button
         await self.click_add_project_button()
-        await self.page.wait_for_timeout(3000)
-        
+
         # Step 2: Verify Add project heading is visible
         await self.verify_add_project_heading_visible()
-        await self.page.wait_for_timeout(2000)
-        
+
         # Step 3: Select customer
         await self.select_nvidia_customer()
-        await self.page.wait_for_timeout(2000)
-        
-        # Step 4: Enter project name
-        await self.enter_project_name(project_name)
-        await self.page.wait_for_timeout(2000)
-        
-        # Step 5: Select source language
-        await self.select_source_language()
-        await self.page.wait_for_timeout(2000)
-        
+
+        # Steps 4-5: the name field and source-language dropdown are
+        # independent, so both interactions run concurrently. The customer
+        # selection above stays sequential: it can repopulate dependent
+        # fields and must settle before the rest of the form is touched
+        await asyncio.gather(
+            self.enter_project_name(project_name),
+            self.select_source_language(),
+        )
+
         # Step 6: Select target language
         await self.select_german_target_language()
-        await self.page.wait_for_timeout(2000)
-        
+
         # Step 7: Upload file
         await self.upload_file(file_path)
-        await self.page.wait_for_timeout(3000)
-        
+
         # Step 8: Select workflow
         await self.select_workflow()
-        await self.page.wait_for_timeout(2000)
-        
+
         # Step 9: Click Create button
         await self.click_create_button()
-        await self.page.wait_for_timeout(5000)
-        
+
+        # Step 10: the form tears down once creation is accepted; waiting
+        # for the Add project heading to leave the DOM replaces the fixed
+        # post-create sleep
+        iframe = await self._get_iframe()
+        try:
+            await iframe.locator(self.ADD_PROJECT_HEADING).wait_for(state="hidden", timeout=30000)
+        except Exception:
+            logger.warning("Add project heading still visible after create; continuing")
+
         logger.info("XTM project creation workflow completed")
-    
+
+    @classmethod
+    async def create_many(cls, browser, username, password, specs):
+        """
+        Create several XTM projects concurrently on isolated contexts.
+
+        Each spec gets its own BrowserContext with its own cookies and
+        page, so the logins and project creations overlap instead of
+        running serially — wall time approaches that of a single
+        creation, bounded by the XTM backend's concurrency.
+
+        Args:
+            browser: Playwright Browser to open the contexts on
+            username (str): XTM username shared by all workers
+            password (str): XTM password shared by all workers
+            specs (list): (project_name, file_path) tuples, one per project
+        """
+        logger.info("Creating %s XTM projects in parallel", len(specs))
+        contexts = [await browser.new_context() for _ in specs]
+        try:
+            pages = [cls(await context.new_page()) for context in contexts]
+
+            async def _create_one(page_obj, spec):
+                project_name, file_path = spec
+                await page_obj.complete_login_workflow(username, password)
+                await page_obj.create_xtm_project(project_name, file_path)
+
+            await asyncio.gather(
+                *[_create_one(page_obj, spec) for page_obj, spec in zip(pages, specs)]
+            )
+            logger.info("All %s parallel project creations completed", len(specs))
+        finally:
+            for context in contexts:
+                await context.close()
+
     # ===========================================
     # SEARCH METHODS
     # ===========================================
@@ -433,16 +444,13 @@ class XTMProjectPage:
         Returns:
             bool: True if search was successful, False otherwise
         """
-        logger.info(f"Starting search for project: {projectname}")
+        logger.info("Starting search for project: %s", projectname)
         
         try:
-            # Wait for iframe to be ready
-            await self.page.wait_for_selector(self.PROJECTS_IFRAME, timeout=15000)
+            # Get the cached iframe content
+            iframe = await self._get_iframe()
             logger.info("Projects iframe is ready")
             
-            # Get the iframe content
-            iframe = self.page.frame_locator(self.PROJECTS_IFRAME)
-            
             # Wait for search input field to be visible
             search_field = iframe.locator(self.SEARCH_INPUT_FIELD)
             await expect(search_field).to_be_visible(timeout=10000)
@@ -451,7 +459,7 @@ class XTMProjectPage:
             # Clear any existing text and enter search term
             await search_field.clear()
             await search_field.fill(projectname)
-            logger.info(f"Entered search term: {projectname}")
+            logger.info("Entered search term: %s", projectname)
             
             # Press Enter to trigger search
             await search_field.press("Enter")
@@ -464,7 +472,7 @@ class XTMProjectPage:
             return True
             
         except Exception as e:
-            logger.error(f"Error occurred during project search: {str(e)}")
+            logger.error("Error occurred during project search: %s", str(e))
             return False
     
     async def verify_project_and_click(self, project_name):
@@ -477,31 +485,28 @@ class XTMProjectPage:
         Returns:
             bool: True if project was found and clicked successfully, False otherwise
         """
-        logger.info(f"Verifying and clicking on project: {project_name}")
+        logger.info("Verifying and clicking on project: %s", project_name)
         
         try:
-            # Wait for iframe to be ready
-            await self.page.wait_for_selector(self.PROJECTS_IFRAME, timeout=15000)
+            # Get the cached iframe content
+            iframe = await self._get_iframe()
             logger.info("Projects iframe is ready")
             
-            # Get the iframe content
-            iframe = self.page.frame_locator(self.PROJECTS_IFRAME)
-            
             # Create locator for project row using data-projectname attribute
             project_row_locator = iframe.locator(self.PROJECT_ROW_BY_NAME.format(project_name=project_name))
             
             # Wait for project row to be visible
             await expect(project_row_locator).to_be_visible(timeout=10000)
-            logger.info(f"Project row found for: {project_name}")
+            logger.info("Project row found for: %s", project_name)
             
             # Verify project name in the cell
             project_name_cell = project_row_locator.locator(self.PROJECT_NAME_CELL)
             await expect(project_name_cell).to_be_visible(timeout=5000)
-            logger.info(f"Project name cell is visible for: {project_name}")
+            logger.info("Project name cell is visible for: %s", project_name)
             
             # Click on the project row
             await project_row_locator.click()
-            logger.info(f"Successfully clicked on project: {project_name}")
+            logger.info("Successfully clicked on project: %s", project_name)
             
             # Wait a moment for navigation
             await self.page.wait_for_timeout(3000)
@@ -510,7 +515,7 @@ class XTMProjectPage:
             return True
             
         except Exception as e:
-            logger.error(f"Error occurred while verifying and clicking project: {str(e)}")
+            logger.error("Error occurred while verifying and clicking project: %s", str(e))
             return False
     
     # ===========================================
@@ -537,7 +542,7 @@ class XTMProjectPage:
             return True
             
         except Exception as e:
-            logger.error(f"Error occurred while clicking workflow link: {str(e)}")
+            logger.error("Error occurred while clicking workflow link: %s", str(e))
             return False
 
     
@@ -592,7 +597,7 @@ class XTMProjectPage:
         count = await lock_icons.count()
         
         if count > 0:
-            logger.info(f"Found {count} lock icon(s) in the page")
+            logger.info("Found %s lock icon(s) in the page", count)
             return True
         else:
             logger.info("No lock icons found in the page")
@@ -633,11 +638,11 @@ class XTMProjectPage:
                 f.write(f"<!-- HTML Dump - {time.strftime('%Y-%m-%d %H:%M:%S')} -->\n")
                 f.write(page_source)
             
-            logger.info(f"HTML dumped to {html_file}")
+            logger.info("HTML dumped to %s", html_file)
             return html_file
             
         except Exception as e:
-            logger.error(f"Failed to dump HTML: {str(e)}")
+            logger.error("Failed to dump HTML: %s", str(e))
             return None
 
     # ===========================================
@@ -681,7 +686,7 @@ class XTMProjectPage:
         
         # Return the new page URL
         new_url = page1.url
-        logger.info(f"New tab URL: {new_url}")
+        logger.info("New tab URL: %s", new_url)
         return new_url
     
     # ===========================================
@@ -728,7 +733,7 @@ class XTMProjectPage:
             logger.info("Login completed successfully")
             
             # Step 2: Search project
-            logger.info(f"Step 2: Searching for project: {projectName}")
+            logger.info("Step 2: Searching for project: %s", projectName)
             await self.search_xtm_project(projectName)
             logger.info("Project search completed")
             
@@ -738,7 +743,7 @@ class XTMProjectPage:
             logger.info("Search results loaded")
             
             # Step 4: Verify project row and click
-            logger.info(f"Step 4: Verifying and clicking project: {projectName}")
+            logger.info("Step 4: Verifying and clicking project: %s", projectName)
             await self.verify_project_and_click(projectName)
             logger.info("Project clicked successfully")
             
@@ -770,7 +775,7 @@ class XTMProjectPage:
             # Step 10: Right-click on file section
             logger.info("Step 10: Right-clicking on file section")
             newtab = await self.right_click_and_redirect_segment_section()
-            logger.info(f"Right-click on file section completed to new tab: {newtab}")
+            logger.info("Right-click on file section completed to new tab: %s", newtab)
             
             # Step 11: Wait for context menu
             logger.info("Step 11: Waiting for context menu")
@@ -808,7 +813,7 @@ class XTMProjectPage:
             return True
             
         except Exception as e:
-            logger.error(f"Error occurred during comprehensive workflow: {str(e)}")
+            logger.error("Error occurred during comprehensive workflow: %s", str(e))
             return False
         
         
\ No newline at end of file
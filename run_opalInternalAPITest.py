@@ -3,6 +3,7 @@
 Script to run OpalInternalFlowAPI tests in the correct order using pytest.
 """
 import pytest
+import asyncio
 import sys
 import os
 import time
@@ -130,7 +131,7 @@ def main():
     # Generate Allure Report
     print("\n📊 Generating Allure Report...")
     try:
-        generate_allure_html()
+        asyncio.run(generate_allure_html())
         print("✅ Allure report generated successfully!")
         print("🌐 Open allure-report/index.html to view the report")
     except Exception as e:
@@ -3,6 +3,7 @@
 Script to run project creation tests in the correct order.
 """
 import subprocess
+import asyncio
 import sys
 import os
 
@@ -95,7 +96,7 @@ def main():
     print("\n📊 Generating Allure Report...")
     try:
         from generate_allure_html import generate_allure_html
-        generate_allure_html()
+        asyncio.run(generate_allure_html())
         print("✅ Allure report generated successfully!")
     except Exception as e:
         print(f"❌ Failed to generate Allure report: {e}")
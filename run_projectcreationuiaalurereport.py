@@ -2,6 +2,7 @@
 """
 Script to run UI test cases for project creation, scheduling, and searching with Allure reporting.
 """
+import asyncio
 import sys
 import os
 import time
@@ -137,7 +138,7 @@ def main():
         
         # Generate Allure HTML report using existing helper
         print("📊 Generating Allure HTML Report...")
-        generate_allure_html()
+        asyncio.run(generate_allure_html())
         return 1
     
     # Wait for 10 minutes
@@ -172,7 +173,7 @@ def main():
     
     # Generate Allure HTML report using existing helper
     print("📊 Generating Allure HTML Report...")
-    generate_allure_html()
+    asyncio.run(generate_allure_html())
     
     return 0
 
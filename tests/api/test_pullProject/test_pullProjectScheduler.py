@@ -27,6 +27,7 @@ class TestPullProjectScheduler:
             self.test_data = json.load(f)
     
     @pytest.mark.projectcreation
+    @pytest.mark.serial
     def test_02_pull_project_trigger_job(self):
         """
         Test triggering XTM pull project job.
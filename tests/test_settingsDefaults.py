@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Unit tests pinning the parsed default configuration flags.
+
+These booleans drive real behavior with no test in front of it —
+VIDEO_RECORDING, for one, attaches record_video_dir to every browser
+context — so a silently changed default would alter every run. No
+browser or network is needed to check them.
+"""
+import sys
+import os
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from config.settings import config, _bool
+
+
+def test_boolean_flag_defaults():
+    """Each behavior flag keeps its documented default."""
+    assert config.VIDEO_RECORDING is True
+    assert config.SCREENSHOT_ON_FAILURE is True
+    assert config.SCREENSHOT_FULL_PAGE is True
+    assert config.SCREENSHOT_INCLUDE_TEST_NAME is True
+    assert config.SCREENSHOT_INCLUDE_TIMESTAMP is True
+    assert config.SCREENSHOT_FAILED_TESTS_ONLY is True
+    # Derived at import from the two flags above
+    assert config.SCREENSHOT_FOR_FAILURE is True
+
+
+def test_headless_defaults():
+    """RUN_HEADLESS wins and resolves the effective HEADLESS flag."""
+    assert config.RUN_HEADLESS is True
+    assert config.HEADLESS_MODE == "true"
+    assert config.HEADLESS is True
+
+
+def test_bool_cast_spellings():
+    """_bool accepts the documented truthy spellings, any case."""
+    for raw in ("true", "TRUE", "1", "yes", "On"):
+        assert _bool(raw) is True
+    for raw in ("false", "FALSE", "0", "no", "off", ""):
+        assert _bool(raw) is False
@@ -25,6 +25,7 @@ async def browser_setup():
     yield
     await browser_client.close_browser()
 
+@pytest.mark.serial
 @pytest.mark.asyncio
 async def test_create_scheduler(browser_setup):
     """Test creating a new scheduler job."""
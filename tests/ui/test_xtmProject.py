@@ -1,33 +1,27 @@
 #!/usr/bin/env python3
 """
 XTM Project Manager UI Test - Simple login and verify heading.
+
+Uses the session-scoped shared browser from tests/conftest.py instead of
+launching its own, so the Chromium startup cost is paid once per worker.
 """
 import pytest
-import pytest_asyncio
 import sys
 import os
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
-from utils.browser_client import browser_client
 from utils.config_parser import get_config_value
 from config.settings import config
 from pages.xtm_project_page import XTMProjectPage
 
-@pytest_asyncio.fixture(scope="function")
-async def browser_setup():
-    """Setup browser for each test."""
-    await browser_client.start_browser(headless=False)
-    yield
-    await browser_client.close_browser()
-
-@pytest.mark.asyncio
-async def test_xtm_login_and_verify_heading(browser_setup):
+@pytest.mark.asyncio(loop_scope="session")
+async def test_xtm_login_and_verify_heading(shared_page):
     """Test login to XTM and verify Projects heading."""
     # Load credentials using utility
     username = get_config_value("credentials", "username")
     password = get_config_value("credentials", "password")
-    
-    xtm_page = XTMProjectPage(browser_client.page)
-    await xtm_page.complete_login_workflow(username, "#Zbb<h5Ec5h&")
\ No newline at end of file
+
+    xtm_page = XTMProjectPage(shared_page)
+    await xtm_page.complete_login_workflow(username, "#Zbb<h5Ec5h&")
@@ -24,6 +24,7 @@ async def browser_setup():
     await browser_client.close_browser()
 
 @pytest.mark.projectcreation
+@pytest.mark.serial
 @pytest.mark.asyncio
 async def test_01_create_xtm_project(browser_setup):
     """Test creating a new XTM project."""
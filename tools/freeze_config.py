@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Freeze the resolved environment into config/_frozen.py.
+
+Run once at install/deploy time. The generated module captures the fully
+resolved environment (after .env parsing) as a literal dict, so later
+imports of config.settings load pure bytecode instead of re-parsing .env.
+Delete config/_frozen.py to return to dynamic resolution.
+"""
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+def freeze():
+    """Write config/_frozen.py from the currently resolved environment."""
+    import config.settings  # noqa: F401 - runs load_dotenv() and snapshotting
+
+    target = Path(__file__).parent.parent / "config" / "_frozen.py"
+    lines = [
+        '"""',
+        "Generated by tools/freeze_config.py - do not edit by hand.",
+        '"""',
+        "ENV = {",
+    ]
+    for key in sorted(os.environ):
+        lines.append(f"    {key!r}: {os.environ[key]!r},")
+    lines.append("}")
+    target.write_text("\n".join(lines) + "\n")
+    print(f"Frozen environment written to {target}")
+
+
+if __name__ == "__main__":
+    freeze()
@@ -6,9 +6,27 @@ import asyncio
 import os
 from pathlib import Path
 from playwright.async_api import async_playwright, Browser, BrowserContext, Page
-from config.settings import config
+from config.settings import (
+    config,
+    get_headless_mode,
+    should_take_screenshot_for_failure,
+    should_take_screenshots,
+)
 from utils.logger import logger
 
+# Third-party hosts (trackers, analytics, web fonts) that the portals pull
+# in but that never affect selector- or text-based assertions
+BLOCKED_HOSTS = (
+    "googletagmanager.com",
+    "google-analytics.com",
+    "segment.io",
+    "segment.com",
+    "fonts.googleapis.com",
+    "fonts.gstatic.com",
+    "hotjar.com",
+    "doubleclick.net",
+)
+
 class BrowserClient:
     """Playwright browser client for UI automation."""
     
@@ -21,7 +39,8 @@ class BrowserClient:
     async def start_browser(self, browser_type: str = None, headless: bool = None, args: list = None):
         """Start browser instance with enhanced configuration."""
         browser_type = browser_type or config.BROWSER_TYPE
-        headless = headless if headless is not None else config.get_headless_mode()
+        headless = headless if headless is not None else get_headless_mode()
+        args = args or config.BROWSER_ARGS
         
         logger.info(f"Starting {browser_type} browser (headless: {headless}, mode: {config.HEADLESS_MODE})")
         
@@ -44,7 +63,7 @@ class BrowserClient:
         
         # Add custom args if provided
         if args:
-            launch_options["args"] = args
+            launch_options["args"] = list(args)
         
         self.browser = await browser_launcher.launch(**launch_options)
         
@@ -58,10 +77,23 @@ class BrowserClient:
         # Add video recording - Playwright will handle failure-only logic
         if config.VIDEO_RECORDING:
             context_options["record_video_dir"] = config.VIDEO_PATH
-        
+
+        # Reuse a cached login session if one was saved recently enough;
+        # stale state is ignored so expired cookies trigger a fresh login
+        state_path = config.STORAGE_STATE_PATH
+        if os.path.exists(state_path):
+            import time
+            if time.time() - os.path.getmtime(state_path) < config.STORAGE_STATE_TTL:
+                context_options["storage_state"] = state_path
+                logger.info(f"Reusing login storage state from {state_path}")
+
         # Create context
         self.context = await self.browser.new_context(**context_options)
         
+        # Block heavy resource types and tracker hosts before any page loads
+        if config.BLOCKED_RESOURCES or BLOCKED_HOSTS:
+            await self._setup_resource_blocking()
+
         # Create page
         self.page = await self.context.new_page()
         
@@ -156,13 +188,13 @@ class BrowserClient:
     async def take_screenshot(self, name: str = None, full_page: bool = None, test_failed: bool = False):
         """Take screenshot with configurable options and failure detection."""
         # Check if screenshots should be taken based on failure status
-        if test_failed and not config.should_take_screenshot_for_failure():
+        if test_failed and not should_take_screenshot_for_failure():
             logger.info("Screenshot skipped - not configured for failed tests only")
             return None
         elif not test_failed and config.SCREENSHOT_FAILED_TESTS_ONLY:
             logger.info("Screenshot skipped - only taking screenshots for failed tests")
             return None
-        elif not config.should_take_screenshots():
+        elif not should_take_screenshots():
             return None
             
         if not name:
@@ -260,6 +292,28 @@ class BrowserClient:
             self.page.on("request", handle_request)
             self.page.on("response", handle_response)
     
+    async def _setup_resource_blocking(self):
+        """Abort requests for blocked resource types and tracker hosts.
+
+        Cuts bytes on the wire and JS parse time during the Okta/portal
+        page loads; assertions are selector/text based so dropped images,
+        fonts and analytics never change test outcomes.
+        """
+        logger.info(f"Blocking resource types: {sorted(config.BLOCKED_RESOURCES)}")
+
+        blocked_types = config.BLOCKED_RESOURCES
+
+        async def handle_route(route):
+            request = route.request
+            if request.resource_type in blocked_types or any(
+                host in request.url for host in BLOCKED_HOSTS
+            ):
+                await route.abort()
+            else:
+                await route.continue_()
+
+        await self.context.route("**/*", handle_route)
+
     async def _setup_network_monitoring(self):
         """Setup network monitoring."""
         logger.info("Setting up network monitoring")
@@ -5,14 +5,21 @@ Simple Config Parser Utility for reading configuration files.
 import configparser
 import os
 import sys
+from functools import lru_cache
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
 from config.settings import config
 
+@lru_cache(maxsize=None)
 def get_config_value(section: str, key: str, file_path):
-    """Read config file and return value based on section.key."""
+    """Read config file and return value based on section.key.
+
+    Results are cached for the process lifetime: the ini files hold test
+    data and credentials that do not change mid-run, so each file is
+    parsed at most once instead of on every lookup.
+    """
     file_path = os.path.join(config.UI_TESTDATA_PATH, file_path)
     config_parser = configparser.ConfigParser()
     config_parser.read(file_path)
@@ -48,30 +48,30 @@ class Logger:
         # Ensure logs are flushed immediately
         self.logger.propagate = True
     
-    def info(self, message: str):
-        """Log info message."""
-        self.logger.info(message)
+    def info(self, message: str, *args):
+        """Log info message; extra args are %-formatted lazily."""
+        self.logger.info(message, *args)
         # Force flush for IDE compatibility
         sys.stdout.flush()
     
-    def debug(self, message: str):
-        """Log debug message."""
-        self.logger.debug(message)
+    def debug(self, message: str, *args):
+        """Log debug message; extra args are %-formatted lazily."""
+        self.logger.debug(message, *args)
         sys.stdout.flush()
     
-    def warning(self, message: str):
-        """Log warning message."""
-        self.logger.warning(message)
+    def warning(self, message: str, *args):
+        """Log warning message; extra args are %-formatted lazily."""
+        self.logger.warning(message, *args)
         sys.stdout.flush()
     
-    def error(self, message: str):
-        """Log error message."""
-        self.logger.error(message)
+    def error(self, message: str, *args):
+        """Log error message; extra args are %-formatted lazily."""
+        self.logger.error(message, *args)
         sys.stdout.flush()
     
-    def critical(self, message: str):
-        """Log critical message."""
-        self.logger.critical(message)
+    def critical(self, message: str, *args):
+        """Log critical message; extra args are %-formatted lazily."""
+        self.logger.critical(message, *args)
         sys.stdout.flush()
     
     def log_request(self, method: str, url: str, status_code: int = None, response_time: float = None):